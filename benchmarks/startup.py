@@ -0,0 +1,103 @@
+"""
+Startup benchmark for short CLI invocations (git hooks, chat bots).
+
+Measures, in fresh interpreters:
+- import time of the CLI entry module
+- time-to-first-output of `--dry-run` on a small input
+
+Usage (from the directory that contains the `deadline/` package):
+
+    python -m deadline.benchmarks.startup --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SAMPLE_INPUT = (
+    "I'll fix this bug next week.\n"
+    "We should revisit the onboarding flow later.\n"
+    "This looks good to me.\n"
+)
+
+_PKG_DIR = Path(__file__).resolve().parents[1]
+_PKG_NAME = _PKG_DIR.name
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_PKG_DIR.parent), env.get("PYTHONPATH")) if p
+    )
+    # Startup must not depend on LLM configuration.
+    env.pop("DEADLINE_LLM_BASE_URL", None)
+    return env
+
+
+def _time_import(env: dict) -> float:
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {_PKG_NAME}.main; "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.strip())
+
+
+def _time_first_output(env: dict) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", f"{_PKG_NAME}.main", "--dry-run"],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    proc.stdin.write(SAMPLE_INPUT)
+    proc.stdin.close()
+    proc.stdout.readline()
+    elapsed = time.perf_counter() - start
+    proc.stdout.read()
+    proc.wait()
+    if proc.returncode != 0:
+        raise RuntimeError(f"dry run exited with {proc.returncode}")
+    return elapsed
+
+
+def _report(name: str, samples: list[float]) -> str:
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{name:<22} median {statistics.median(ms):8.2f} ms   "
+        f"min {min(ms):8.2f} ms   max {max(ms):8.2f} ms"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Deadline CLI startup benchmark.")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement.")
+    args = parser.parse_args(argv)
+
+    env = _env()
+    imports = [_time_import(env) for _ in range(args.runs)]
+    first = [_time_first_output(env) for _ in range(args.runs)]
+
+    print(_report("import main", imports))
+    print(_report("time-to-first-output", first))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, insort
+from calendar import monthrange
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..schemas.commitment import Commitment, CommitmentStatus
+
+
+class _Rule(NamedTuple):
+    """Anchor-independent parse result for one normalised phrase."""
+
+    kind: str  # "days" | "weekday" | "week_end" | "month_end" | "absolute"
+    value: int = 0
+    offset: int = 0  # weeks / months to shift, depending on kind
+    absolute: Optional[date] = None
+
+
+_WEEKDAYS_EN = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+
+_WEEKDAYS_ZH = {
+    "一": 0, "二": 1, "三": 2, "四": 3, "五": 4, "六": 5, "日": 6, "天": 6,
+}
+
+_FIXED_EN = {
+    "today": _Rule("days", 0),
+    "tonight": _Rule("days", 0),
+    "eod": _Rule("days", 0),
+    "end of day": _Rule("days", 0),
+    "end of the day": _Rule("days", 0),
+    "tomorrow": _Rule("days", 1),
+    "the day after tomorrow": _Rule("days", 2),
+    "this week": _Rule("week_end", offset=0),
+    "end of week": _Rule("week_end", offset=0),
+    "end of the week": _Rule("week_end", offset=0),
+    "eow": _Rule("week_end", offset=0),
+    "next week": _Rule("week_end", offset=1),
+    "end of next week": _Rule("week_end", offset=1),
+    "this month": _Rule("month_end", offset=0),
+    "end of month": _Rule("month_end", offset=0),
+    "end of the month": _Rule("month_end", offset=0),
+    "eom": _Rule("month_end", offset=0),
+    "next month": _Rule("month_end", offset=1),
+}
+
+_FIXED_ZH = {
+    "今天": _Rule("days", 0),
+    "今晚": _Rule("days", 0),
+    "明天": _Rule("days", 1),
+    "后天": _Rule("days", 2),
+    "本周": _Rule("week_end", offset=0),
+    "这周": _Rule("week_end", offset=0),
+    "周末": _Rule("week_end", offset=0),
+    "下周": _Rule("week_end", offset=1),
+    "下星期": _Rule("week_end", offset=1),
+    "月底": _Rule("month_end", offset=0),
+    "本月": _Rule("month_end", offset=0),
+    "下个月": _Rule("month_end", offset=1),
+    "下月": _Rule("month_end", offset=1),
+}
+
+_EN_PREFIX_RE = re.compile(
+    r"^(?:(?:no later than|at the latest by|by|before|until|till|due|on)\s+)+"
+)
+_ZH_AFFIX_RE = re.compile(r"^(?:在|于)|(?:之前|以前|前|内|为止)$")
+_IN_DAYS_RE = re.compile(r"^(?:in|within)\s+(\d{1,3})\s+(day|days|week|weeks)$")
+_ZH_DAYS_RE = re.compile(r"^(\d{1,3})\s*(天|周)$")
+_EN_WEEKDAY_RE = re.compile(r"^(?:(this|next)\s+)?([a-z]+)$")
+_ZH_WEEKDAY_RE = re.compile(r"^(下)?(?:周|星期|礼拜)([一二三四五六日天])$")
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+
+
+def _normalize_phrase(text: str) -> str:
+    """Lower-case, drop punctuation / filler prefixes, collapse whitespace."""
+    s = text.strip().lower()
+    s = re.sub(r"[.,;:!?。，；：！？]+$", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    s = _EN_PREFIX_RE.sub("", s)
+    s = _ZH_AFFIX_RE.sub("", s)
+    return s.strip()
+
+
+@lru_cache(maxsize=4096)
+def _parse_normalized(phrase: str) -> Optional[_Rule]:
+    """
+    Map a normalised phrase to an anchor-independent rule.
+
+    Memoised: the number of distinct phrases is tiny compared to the number
+    of commitments, so the cache doubles as the parse table.
+    """
+    if phrase in _FIXED_EN:
+        return _FIXED_EN[phrase]
+    if phrase in _FIXED_ZH:
+        return _FIXED_ZH[phrase]
+
+    m = _ISO_DATE_RE.match(phrase)
+    if m:
+        try:
+            return _Rule("absolute", absolute=date(*map(int, m.groups())))
+        except ValueError:
+            return None
+
+    m = _IN_DAYS_RE.match(phrase)
+    if m:
+        n = int(m.group(1))
+        return _Rule("days", n * 7 if m.group(2).startswith("week") else n)
+
+    m = _ZH_DAYS_RE.match(phrase)
+    if m:
+        n = int(m.group(1))
+        return _Rule("days", n * 7 if m.group(2) == "周" else n)
+
+    m = _EN_WEEKDAY_RE.match(phrase)
+    if m and m.group(2) in _WEEKDAYS_EN:
+        return _Rule(
+            "weekday",
+            _WEEKDAYS_EN[m.group(2)],
+            offset=1 if m.group(1) == "next" else 0,
+        )
+
+    m = _ZH_WEEKDAY_RE.match(phrase)
+    if m:
+        return _Rule(
+            "weekday",
+            _WEEKDAYS_ZH[m.group(2)],
+            offset=1 if m.group(1) else 0,
+        )
+
+    return None
+
+
+def _apply_rule(rule: _Rule, anchor: date) -> date:
+    if rule.kind == "absolute":
+        assert rule.absolute is not None
+        return rule.absolute
+    if rule.kind == "days":
+        return anchor + timedelta(days=rule.value)
+    if rule.kind == "week_end":
+        # Weeks end on Sunday.
+        return anchor + timedelta(days=6 - anchor.weekday() + 7 * rule.offset)
+    if rule.kind == "month_end":
+        year = anchor.year + (anchor.month - 1 + rule.offset) // 12
+        month = (anchor.month - 1 + rule.offset) % 12 + 1
+        return date(year, month, monthrange(year, month)[1])
+    # "weekday": next occurrence strictly after the anchor day ("by Monday"
+    # said on a Monday means the following Monday); "next <day>" means that
+    # weekday in the following calendar week.
+    if rule.offset:
+        monday_next = anchor + timedelta(days=7 - anchor.weekday())
+        return monday_next + timedelta(days=rule.value)
+    return anchor + timedelta(days=(rule.value - anchor.weekday()) % 7 or 7)
+
+
+def resolve_deadline_phrase(
+    text: object,
+    anchor: Optional[datetime],
+) -> Optional[datetime]:
+    """
+    Deterministically resolve a deadline phrase relative to ``anchor``.
+
+    Only a closed set of patterns is understood ("tomorrow", "by Friday",
+    "next week", "in 3 days", "2026-02-10", "下周", "周五", ...). Anything
+    else – including non-string input – returns None: we never guess.
+    Without an anchor only explicit dates resolve (as naive values).
+    The resolved value is the end of the deadline day, in the anchor's
+    timezone.
+    """
+    if not isinstance(text, str) or not text:
+        return None
+    rule = _parse_normalized(_normalize_phrase(text))
+    if rule is None:
+        return None
+    if anchor is None:
+        if rule.kind != "absolute":
+            return None
+        assert rule.absolute is not None
+        return datetime.combine(rule.absolute, time.max)
+    day = _apply_rule(rule, anchor.date())
+    return datetime.combine(day, time.max, tzinfo=anchor.tzinfo)
+
+
+def _utc_naive(d: datetime) -> datetime:
+    """Comparable form of a datetime: aware values converted, naive = UTC."""
+    if d.tzinfo is None:
+        return d
+    return d.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def deadline_status(deadline_date: datetime, now: datetime) -> CommitmentStatus:
+    """OVERDUE iff the deadline is strictly before `now`, else PENDING."""
+    if _utc_naive(deadline_date) < _utc_naive(now):
+        return CommitmentStatus.OVERDUE
+    return CommitmentStatus.PENDING
+
+
+@dataclass
+class DeadlineIndex:
+    """
+    Commitments ordered by resolved deadline, so "what is overdue at T"
+    is a bisect plus a slice instead of a full scan.
+
+    Keys are stored as UTC-naive datetimes (naive inputs are taken to be
+    UTC), so naive and aware deadlines / query times can be mixed. Query
+    results have their `status` refreshed for the given `now`.
+
+    Commitments without an explicit_deadline_date are not indexed.
+    """
+
+    _keys: List[Tuple[datetime, str]] = field(default_factory=list)
+    # id -> (key it is stored under, commitment); the key is kept so an
+    # entry can be removed even if the commitment's date was mutated since.
+    _by_id: Dict[str, Tuple[Tuple[datetime, str], Commitment]] = field(
+        default_factory=dict
+    )
+
+    @staticmethod
+    def _key(commitment: Commitment) -> Tuple[datetime, str]:
+        assert commitment.explicit_deadline_date is not None
+        return (_utc_naive(commitment.explicit_deadline_date), commitment.id)
+
+    def _discard(self, commitment_id: str) -> None:
+        entry = self._by_id.pop(commitment_id, None)
+        if entry is None:
+            return
+        key = entry[0]
+        pos = bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            del self._keys[pos]
+
+    def add(self, commitment: Commitment) -> None:
+        """
+        Insert one commitment; re-adding an id replaces its entry, and
+        re-adding it without a deadline removes it.
+        """
+        self._discard(commitment.id)
+        if commitment.explicit_deadline_date is None:
+            return
+        key = self._key(commitment)
+        insort(self._keys, key)
+        self._by_id[commitment.id] = (key, commitment)
+
+    def extend(self, commitments: Iterable[Commitment]) -> None:
+        """Bulk insert: append all keys, then sort once (O(n log n))."""
+        batch: Dict[str, Optional[Commitment]] = {}
+        for c in commitments:
+            batch[c.id] = c if c.explicit_deadline_date is not None else None
+        if not batch:
+            return
+        stale = {
+            self._by_id.pop(cid)[0] for cid in batch if cid in self._by_id
+        }
+        if stale:
+            self._keys = [k for k in self._keys if k not in stale]
+        for cid, c in batch.items():
+            if c is None:
+                continue
+            key = self._key(c)
+            self._keys.append(key)
+            self._by_id[cid] = (key, c)
+        self._keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _split(self, now: datetime) -> int:
+        # Everything strictly before `now` is overdue.
+        return bisect_left(self._keys, (_utc_naive(now), ""))
+
+    def _take(
+        self,
+        keys: List[Tuple[datetime, str]],
+        now: datetime,
+    ) -> List[Commitment]:
+        out = []
+        for deadline, cid in keys:
+            c = self._by_id[cid][1]
+            c.status = deadline_status(deadline, now)
+            out.append(c)
+        return out
+
+    def status(self, commitment_id: str, now: datetime) -> CommitmentStatus:
+        """Status of an indexed commitment at `now` (UNCLEAR if not indexed)."""
+        entry = self._by_id.get(commitment_id)
+        if entry is None:
+            return CommitmentStatus.UNCLEAR
+        return deadline_status(entry[0][0], now)
+
+    def overdue(self, now: datetime) -> List[Commitment]:
+        return self._take(self._keys[: self._split(now)], now)
+
+    def pending(self, now: datetime) -> List[Commitment]:
+        return self._take(self._keys[self._split(now):], now)
+
+    def due_between(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        now: datetime,
+    ) -> List[Commitment]:
+        lo = bisect_left(self._keys, (_utc_naive(start), ""))
+        hi = bisect_left(self._keys, (_utc_naive(end), ""))
+        return self._take(self._keys[lo:hi], now)
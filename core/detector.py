@@ -38,6 +38,14 @@ def _keyword_prefilter(sentence: str) -> bool:
     return any(k in lower for k in COMMITMENT_KEYWORDS)
 
 
+def prefilter_candidates(sentences: List[SentenceSpan]) -> List[SentenceSpan]:
+    """
+    Sentences that pass the keyword prefilter, i.e. the ones that
+    detect_commitment_sentences would send to the LLM.
+    """
+    return [span for span in sentences if _keyword_prefilter(span.text)]
+
+
 def detect_commitment_sentences(
     llm: LLMClient,
     sentences: List[SentenceSpan],
@@ -51,10 +59,7 @@ def detect_commitment_sentences(
     """
     results: List[SentenceSpan] = []
 
-    for span in sentences:
-        if not _keyword_prefilter(span.text):
-            continue
-
+    for span in prefilter_candidates(sentences):
         user_prompt = COMMITMENT_DETECTION_USER_TEMPLATE.format(
             sentence=span.text
         )
@@ -16,6 +16,7 @@ from ..schemas.commitment import (
     CommitmentStatus,
     SourceMessage,
 )
+from .deadlines import DeadlineIndex, deadline_status, resolve_deadline_phrase
 
 
 def _extract_attributes(
@@ -44,7 +45,8 @@ def _compute_status(
 ) -> CommitmentStatus:
     if deadline_date is None:
         return CommitmentStatus.UNCLEAR
-    return CommitmentStatus.OVERDUE if deadline_date < now else CommitmentStatus.PENDING
+    # Same rule DeadlineIndex uses for its overdue / pending split.
+    return deadline_status(deadline_date, now)
 
 
 def resolve_commitments(
@@ -53,6 +55,8 @@ def resolve_commitments(
     message_index_to_source: list[SourceMessage],
     classified_items: list[tuple],
     now: datetime | None = None,
+    resolve_deadlines: bool = False,
+    index: DeadlineIndex | None = None,
 ) -> List[Commitment]:
     """
     Turn classified commitment sentences into fully structured commitments.
@@ -63,8 +67,14 @@ def resolve_commitments(
     Deadline policy:
     - We NEVER invent calendar dates.
     - We store the exact deadline phrase as text.
-    - explicit_deadline_date is kept None for now (can be resolved later by
-      a deterministic date parser if expressly desired).
+    - explicit_deadline_date stays None unless resolve_deadlines=True, in
+      which case core.deadlines resolves a closed set of phrases against the
+      source message timestamp. Unknown phrases, and relative phrases in
+      messages without a timestamp, still yield None.
+
+    If `index` is given, every commitment with a resolved date is added to it
+    so overdue / pending lookups at any later `now` can be answered by range
+    scans (which also refresh each returned commitment's status).
     """
     now = now or datetime.utcnow()
     commitments: List[Commitment] = []
@@ -72,12 +82,16 @@ def resolve_commitments(
     for span, kind, confidence, raw_label in classified_items:
         attrs = _extract_attributes(llm, span.text)
 
-        # Explicitly do NOT parse deadline_text into a concrete date here.
         deadline_text = attrs.get("deadline_text")
+        src = message_index_to_source[span.source_index]
+
         deadline_date = None
+        if resolve_deadlines:
+            # Anchor on the message itself, never on processing time:
+            # without a timestamp only explicit dates resolve.
+            deadline_date = resolve_deadline_phrase(deadline_text, src.timestamp)
 
         status = _compute_status(deadline_date=deadline_date, now=now)
-        src = message_index_to_source[span.source_index]
 
         commitment = Commitment(
             id=str(uuid.uuid4()),
@@ -95,5 +109,8 @@ def resolve_commitments(
         )
         commitments.append(commitment)
 
+    if index is not None:
+        index.extend(commitments)
+
     return commitments
 
@@ -3,8 +3,6 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, Optional
 
-import requests
-
 
 class LLMClient:
     """
@@ -15,6 +13,10 @@ class LLMClient:
     - Local models
     - Enterprise gateways
     without changing core business logic.
+
+    Construction is cheap and never fails: configuration is validated and
+    `requests` is imported on the first real network call, so pipelines
+    that never reach the LLM (dry runs, empty inputs) need neither.
     """
 
     def __init__(
@@ -29,9 +31,6 @@ class LLMClient:
         self.model = model or os.getenv("DEADLINE_LLM_MODEL", "gpt-4.1-mini")
         self.timeout = timeout
 
-        if not self.base_url:
-            raise ValueError("LLM base URL is not configured (DEADLINE_LLM_BASE_URL).")
-
     def chat(self, system_prompt: str, user_prompt: str) -> str:
         """
         Generic chat-style call.
@@ -39,6 +38,11 @@ class LLMClient:
         The exact payload here assumes an OpenAI-compatible API.
         Adapt this to your actual provider if needed.
         """
+        if not self.base_url:
+            raise ValueError("LLM base URL is not configured (DEADLINE_LLM_BASE_URL).")
+
+        import requests
+
         headers = {
             "Content-Type": "application/json",
         }
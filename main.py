@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import argparse
 import sys
+from datetime import datetime
 from pathlib import Path
 
-from .core.classifier import classify_commitments
-from .core.detector import detect_commitment_sentences
-from .core.ingest import normalize_from_messages, normalize_from_text
-from .core.resolver import resolve_commitments
-from .llm.client import LLMClient
-from .outputs import formatter
+# Pipeline stages are imported inside main() so that `--help`, argument
+# errors and `--dry-run` stay fast for short-lived CLI invocations.
+
+
+def _iso_timestamp(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO timestamp: {value!r}")
 
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -30,7 +34,45 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         choices=["markdown", "json", "table"],
         help="Output format.",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--resolve-deadlines",
+        action="store_true",
+        help=(
+            "Deterministically resolve simple deadline phrases "
+            "('tomorrow', 'by Friday', '下周') into dates."
+        ),
+    )
+    parser.add_argument(
+        "--timestamp",
+        type=_iso_timestamp,
+        help=(
+            "ISO timestamp of the input text (e.g. 2026-02-02T10:00:00+08:00). "
+            "Relative deadline phrases are anchored to it; without it only "
+            "explicit dates resolve."
+        ),
+    )
+    parser.add_argument(
+        "--overdue",
+        action="store_true",
+        help="Only output overdue commitments (requires --resolve-deadlines).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=(
+            "Run ingest and the keyword prefilter only and report which "
+            "sentences would be sent to the LLM. No network access."
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.overdue and not args.resolve_deadlines:
+        parser.error("--overdue requires --resolve-deadlines")
+    if args.dry_run and (args.resolve_deadlines or args.overdue):
+        parser.error(
+            "--dry-run stops before resolution; it cannot be combined with "
+            "--resolve-deadlines or --overdue"
+        )
+    return args
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -41,10 +83,32 @@ def main(argv: list[str] | None = None) -> int:
     else:
         text = sys.stdin.read()
 
-    # Normalize
-    convo = normalize_from_text(text)
+    from .core.ingest import normalize_from_text
+    from .outputs import formatter
 
-    # Init LLM
+    # Normalize
+    convo = normalize_from_text(text, timestamp=args.timestamp)
+
+    if args.dry_run:
+        from .core.detector import prefilter_candidates
+
+        candidates = prefilter_candidates(convo.sentences)
+        if args.format == "markdown":
+            out = formatter.candidates_to_markdown(candidates)
+        elif args.format == "json":
+            out = formatter.candidates_to_json(candidates)
+        else:
+            out = formatter.candidates_to_table(candidates)
+        print(out)
+        return 0
+
+    from .core.classifier import classify_commitments
+    from .core.detector import detect_commitment_sentences
+    from .core.deadlines import DeadlineIndex
+    from .core.resolver import resolve_commitments
+    from .llm.client import LLMClient
+
+    # Init LLM (configuration is only checked on the first request)
     llm = LLMClient()
 
     # Detection
@@ -56,11 +120,18 @@ def main(argv: list[str] | None = None) -> int:
     classified = classify_commitments(llm=llm, spans=candidate_spans)
 
     # Resolution (who, deadline, status)
+    now = datetime.utcnow()
+    index = DeadlineIndex() if args.resolve_deadlines else None
     commitments = resolve_commitments(
         llm=llm,
         message_index_to_source=convo.messages,
         classified_items=classified,
+        now=now,
+        resolve_deadlines=args.resolve_deadlines,
+        index=index,
     )
+    if args.overdue and index is not None:
+        commitments = index.overdue(now)
 
     # Output
     if args.format == "markdown":
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from typing import Iterable, List
 
-from ..schemas.commitment import Commitment, commitment_to_dict
+from ..schemas.commitment import Commitment, SentenceSpan, commitment_to_dict
 
 
 def to_markdown(commitments: Iterable[Commitment]) -> str:
@@ -46,6 +47,12 @@ def to_table(commitments: Iterable[Commitment]) -> str:
             ]
         )
 
+    return _render_table(rows)
+
+
+def _render_table(rows: List[List[str]]) -> str:
+    headers = rows[0]
+
     # column widths
     col_widths = [0] * len(headers)
     for row in rows:
@@ -65,3 +72,26 @@ def to_table(commitments: Iterable[Commitment]) -> str:
 
     return "\n".join(lines)
 
+
+def candidates_to_markdown(spans: Iterable[SentenceSpan]) -> str:
+    """
+    Dry-run report: sentences that would be sent to the LLM.
+    """
+    lines = [f"- {s.text}" for s in spans]
+    if not lines:
+        return "No candidate sentences."
+    return "\n".join(lines)
+
+
+def candidates_to_json(spans: Iterable[SentenceSpan]) -> str:
+    data = [asdict(s) for s in spans]
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def candidates_to_table(spans: Iterable[SentenceSpan]) -> str:
+    rows: List[List[str]] = [["MESSAGE", "CHARS", "SENTENCE"]]
+    for s in spans:
+        rows.append(
+            [str(s.source_index), f"{s.char_start}-{s.char_end}", s.text]
+        )
+    return _render_table(rows)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pytest
+
+from deadline.llm.client import LLMClient
+
+
+def test_client_constructs_without_base_url(monkeypatch):
+    monkeypatch.delenv("DEADLINE_LLM_BASE_URL", raising=False)
+    llm = LLMClient()
+    assert llm.base_url == ""
+
+    with pytest.raises(ValueError, match="DEADLINE_LLM_BASE_URL"):
+        llm.chat(system_prompt="s", user_prompt="u")
@@ -0,0 +1,165 @@
+"""
+Pins down the meaning of deterministic deadline phrases.
+
+Run from the directory that contains the `deadline/` package:
+
+    python -m pytest deadline/tests
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from deadline.core.deadlines import DeadlineIndex, resolve_deadline_phrase
+from deadline.schemas.commitment import (
+    Commitment,
+    CommitmentStatus,
+    SourceMessage,
+)
+
+MON = datetime(2026, 2, 2, 10)  # Monday
+SAT = datetime(2026, 2, 7, 10)  # Saturday
+CST = timezone(timedelta(hours=8))
+
+
+@pytest.mark.parametrize(
+    "phrase, anchor, expected",
+    [
+        # Bare weekday equal to the anchor's weekday means the following one.
+        ("by Monday", MON, date(2026, 2, 9)),
+        ("周一", MON, date(2026, 2, 9)),
+        ("by Friday", MON, date(2026, 2, 6)),
+        ("周五", SAT, date(2026, 2, 13)),
+        # next <day>: that weekday in the following calendar week.
+        ("next Monday", MON, date(2026, 2, 9)),
+        ("next friday", MON, date(2026, 2, 13)),
+        ("next friday", SAT, date(2026, 2, 13)),
+        ("下周一", SAT, date(2026, 2, 9)),
+        # week_end / month_end across year boundaries (weeks end on Sunday).
+        ("this week", datetime(2026, 12, 30), date(2027, 1, 3)),
+        ("next week", datetime(2026, 12, 30), date(2027, 1, 10)),
+        ("下周", datetime(2026, 12, 30), date(2027, 1, 10)),
+        ("end of month", datetime(2026, 12, 15), date(2026, 12, 31)),
+        ("next month", datetime(2026, 12, 15), date(2027, 1, 31)),
+        ("next month", datetime(2027, 1, 31), date(2027, 2, 28)),
+        # Relative days and explicit dates.
+        ("tomorrow", datetime(2026, 12, 31), date(2027, 1, 1)),
+        ("in 3 days", MON, date(2026, 2, 5)),
+        ("3天内", MON, date(2026, 2, 5)),
+        ("before 2026-02-10.", MON, date(2026, 2, 10)),
+        # Invalid ISO dates and unknown phrases are never guessed.
+        ("2026-02-30", MON, None),
+        ("2026-13-01", MON, None),
+        ("later", MON, None),
+        ("whenever", MON, None),
+        ("", MON, None),
+        (None, MON, None),
+        # Non-string LLM output is never coerced.
+        (3, MON, None),
+        (["tomorrow"], MON, None),
+    ],
+)
+def test_resolve_deadline_phrase(phrase, anchor, expected):
+    got = resolve_deadline_phrase(phrase, anchor)
+    if expected is None:
+        assert got is None
+    else:
+        assert got == datetime.combine(expected, time.max)
+
+
+def test_resolve_keeps_anchor_timezone():
+    aware = resolve_deadline_phrase("tomorrow", datetime(2026, 2, 2, 23, tzinfo=CST))
+    assert aware == datetime(2026, 2, 3, 23, 59, 59, 999999, tzinfo=CST)
+
+    naive = resolve_deadline_phrase("tomorrow", datetime(2026, 2, 2, 23))
+    assert naive is not None and naive.tzinfo is None
+
+
+def test_resolve_without_anchor_only_resolves_explicit_dates():
+    assert resolve_deadline_phrase("tomorrow", None) is None
+    assert resolve_deadline_phrase("by Friday", None) is None
+    assert resolve_deadline_phrase("by 2026-02-10", None) == datetime.combine(
+        date(2026, 2, 10), time.max
+    )
+
+
+def _commitment(cid: str, deadline: datetime | None) -> Commitment:
+    return Commitment(
+        id=cid,
+        sentence=cid,
+        full_message=cid,
+        who="I",
+        kind=None,
+        kind_confidence=1.0,
+        created_at=MON,
+        explicit_deadline_text=None,
+        explicit_deadline_date=deadline,
+        status=CommitmentStatus.PENDING,
+        source=SourceMessage(text=cid),
+    )
+
+
+def test_index_mixes_naive_and_aware_deadlines():
+    index = DeadlineIndex()
+    index.add(_commitment("naive", datetime(2026, 2, 3, 12)))
+    # 2026-02-03 12:00 +08:00 == 04:00 UTC, i.e. before the naive (UTC) one.
+    index.add(_commitment("aware", datetime(2026, 2, 3, 12, tzinfo=CST)))
+
+    now = datetime(2026, 2, 3, 8, tzinfo=timezone.utc)
+    assert [c.id for c in index.overdue(now)] == ["aware"]
+    assert [c.id for c in index.pending(datetime(2026, 2, 3, 8))] == ["naive"]
+
+
+def test_index_queries_refresh_status():
+    c = _commitment("a", datetime(2026, 2, 3))
+    index = DeadlineIndex()
+    index.add(c)
+
+    assert index.overdue(datetime(2026, 2, 4)) == [c]
+    assert c.status is CommitmentStatus.OVERDUE
+    assert index.status("a", datetime(2026, 2, 1)) is CommitmentStatus.PENDING
+    assert index.status("missing", datetime(2026, 2, 1)) is CommitmentStatus.UNCLEAR
+
+
+def test_index_readding_replaces_entry():
+    index = DeadlineIndex()
+    index.add(_commitment("a", datetime(2026, 2, 3)))
+    index.add(_commitment("a", datetime(2026, 2, 10)))
+    index.extend([_commitment("a", datetime(2026, 2, 5)), _commitment("b", None)])
+
+    assert len(index) == 1
+    assert index.overdue(datetime(2026, 2, 4)) == []
+    assert [c.id for c in index.pending(datetime(2026, 2, 4))] == ["a"]
+
+
+def test_index_extend_matches_incremental_add():
+    items = [_commitment(str(i), MON + timedelta(hours=(i * 37) % 101)) for i in range(50)]
+    bulk, one_by_one = DeadlineIndex(), DeadlineIndex()
+    bulk.extend(items)
+    for c in items:
+        one_by_one.add(c)
+    assert bulk._keys == one_by_one._keys
+
+
+def test_index_readding_without_deadline_removes_entry():
+    index = DeadlineIndex()
+    index.add(_commitment("a", datetime(2026, 2, 3)))
+    index.add(_commitment("a", None))
+    assert len(index) == 0
+
+    index.add(_commitment("b", datetime(2026, 2, 3)))
+    index.extend([_commitment("b", None)])
+    assert len(index) == 0
+
+
+def test_index_readding_after_date_mutation_drops_stale_key():
+    c = _commitment("a", datetime(2026, 2, 3))
+    index = DeadlineIndex()
+    index.add(c)
+    c.explicit_deadline_date = datetime(2026, 2, 10)
+    index.add(c)
+
+    assert len(index) == 1
+    assert index.pending(datetime(2026, 2, 1)) == [c]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+
+from deadline.outputs import formatter
+from deadline.schemas.commitment import SentenceSpan
+
+SPANS = [
+    SentenceSpan(text="I'll fix it by Friday.", source_index=0, char_start=0, char_end=22),
+    SentenceSpan(text="We should follow up.", source_index=1, char_start=4, char_end=24),
+]
+
+
+def test_candidates_to_json():
+    assert json.loads(formatter.candidates_to_json(SPANS)) == [
+        {"text": "I'll fix it by Friday.", "source_index": 0, "char_start": 0, "char_end": 22},
+        {"text": "We should follow up.", "source_index": 1, "char_start": 4, "char_end": 24},
+    ]
+    assert json.loads(formatter.candidates_to_json([])) == []
+
+
+def test_candidates_to_table():
+    lines = formatter.candidates_to_table(SPANS).splitlines()
+    assert [line.rstrip() for line in lines] == [
+        "MESSAGE | CHARS | SENTENCE",
+        "--------+-------+-----------------------",
+        "0       | 0-22  | I'll fix it by Friday.",
+        "1       | 4-24  | We should follow up.",
+    ]
+
+
+def test_candidates_to_markdown():
+    assert formatter.candidates_to_markdown(SPANS) == (
+        "- I'll fix it by Friday.\n- We should follow up."
+    )
+    assert formatter.candidates_to_markdown([]) == "No candidate sentences."
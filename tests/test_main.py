@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from deadline.main import main
+
+SAMPLE = "I'll fix this bug next week.\nThis looks good to me.\n"
+
+
+def test_dry_run_prints_only_prefilter_candidates(monkeypatch, capsys):
+    monkeypatch.delenv("DEADLINE_LLM_BASE_URL", raising=False)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(SAMPLE))
+
+    assert main(["--dry-run"]) == 0
+    assert capsys.readouterr().out.strip() == "- I'll fix this bug next week."
+
+
+def test_dry_run_never_imports_requests():
+    # Fresh interpreter, so earlier imports in this process cannot mask a
+    # top-level `import requests` creeping back in.
+    code = (
+        "import sys\n"
+        "from deadline.main import main\n"
+        "main(['--dry-run'])\n"
+        "assert 'requests' not in sys.modules, 'requests was imported'\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    env.pop("DEADLINE_LLM_BASE_URL", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        input=SAMPLE,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "- I'll fix this bug next week."
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--dry-run", "--resolve-deadlines"],
+        ["--dry-run", "--resolve-deadlines", "--overdue"],
+        ["--overdue"],
+    ],
+)
+def test_rejects_ignored_flag_combinations(argv):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from deadline.core.ingest import normalize_from_messages
+from deadline.core.resolver import resolve_commitments
+from deadline.schemas.commitment import CommitmentKind, CommitmentStatus
+
+CST = timezone(timedelta(hours=8))
+
+
+class _FakeLLM:
+    def __init__(self, deadline_text):
+        self.deadline_text = deadline_text
+
+    def chat(self, system_prompt: str, user_prompt: str) -> str:
+        return json.dumps({"who": "I", "deadline_text": self.deadline_text})
+
+
+def _resolve(deadline_text, timestamp, now):
+    convo = normalize_from_messages(
+        [{"text": "I'll fix it.", "timestamp": timestamp}]
+    )
+    classified = [
+        (span, CommitmentKind.PERSONAL_PROMISE, 0.9, {})
+        for span in convo.sentences
+    ]
+    (commitment,) = resolve_commitments(
+        llm=_FakeLLM(deadline_text),
+        message_index_to_source=convo.messages,
+        classified_items=classified,
+        now=now,
+        resolve_deadlines=True,
+    )
+    return commitment
+
+
+def test_relative_phrase_without_timestamp_stays_unresolved():
+    for phrase in ("today", "tomorrow", "by Friday"):
+        c = _resolve(phrase, None, datetime(2026, 2, 4))
+        assert c.explicit_deadline_date is None
+        assert c.status is CommitmentStatus.UNCLEAR
+
+
+def test_explicit_date_without_timestamp_resolves():
+    c = _resolve("2026-02-03", None, datetime(2026, 2, 4))
+    assert c.status is CommitmentStatus.OVERDUE
+
+
+def test_deadline_is_stored_in_anchor_timezone():
+    # Naive anchor is UTC: 2026-02-03 23:59 UTC is 02-04 07:59 +08:00.
+    c = _resolve("tomorrow", datetime(2026, 2, 2, 10), datetime(2026, 2, 4, 1, tzinfo=CST))
+    assert c.explicit_deadline_date == datetime(2026, 2, 3, 23, 59, 59, 999999)
+    assert c.status is CommitmentStatus.PENDING
+
+    c = _resolve("tomorrow", datetime(2026, 2, 2, 10, tzinfo=CST), datetime(2026, 2, 4))
+    assert c.explicit_deadline_date == datetime(2026, 2, 3, 23, 59, 59, 999999, tzinfo=CST)
+    assert c.status is CommitmentStatus.OVERDUE
+
+
+def test_non_string_deadline_text_is_ignored():
+    c = _resolve(3, datetime(2026, 2, 2, 10), datetime(2026, 2, 4))
+    assert c.explicit_deadline_date is None
+    assert c.status is CommitmentStatus.UNCLEAR